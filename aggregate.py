@@ -0,0 +1,88 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+# Worker processes used for partial aggregates; IPL_AGG_WORKERS=1 forces serial execution
+WORKERS = int(os.environ.get('IPL_AGG_WORKERS', os.cpu_count() or 1))
+
+# Inputs smaller than this are aggregated in-process; shipping them to workers costs more than it saves
+MIN_PARALLEL_ROWS = int(os.environ.get('IPL_AGG_MIN_ROWS', 200_000))
+
+_executors = {}
+
+
+def _executor(workers):
+    if workers not in _executors:
+        _executors[workers] = ProcessPoolExecutor(max_workers=workers)
+    return _executors[workers]
+
+
+def shutdown():
+    for executor in _executors.values():
+        executor.shutdown()
+    _executors.clear()
+
+
+def partitions(data, workers):
+    # A list of frames (e.g. one per season or league) is used as-is; a single frame is split by rows
+    # only when there is more than one worker to hand the pieces to
+    if isinstance(data, pd.DataFrame):
+        if workers <= 1 or len(data) <= 1:
+            return [data]
+        return [data.iloc[rows] for rows in np.array_split(np.arange(len(data)), workers) if len(rows)]
+    frames = list(data)
+    return [frame for frame in frames if len(frame)] or frames[:1]
+
+
+def map_reduce(data, mapper, reducer, workers=None, min_rows=None):
+    workers = WORKERS if workers is None else workers
+    min_rows = MIN_PARALLEL_ROWS if min_rows is None else min_rows
+    data = data if isinstance(data, pd.DataFrame) else list(data)
+    total_rows = len(data) if isinstance(data, pd.DataFrame) else sum(len(frame) for frame in data)
+    if workers <= 1 or total_rows < min_rows:
+        # Aggregated in-process, so a single frame is mapped whole rather than split into row chunks
+        partials = [mapper(part) for part in partitions(data, 1)]
+    else:
+        parts = partitions(data, workers)
+        partials = list(_executor(workers).map(mapper, parts)) if len(parts) > 1 else [mapper(parts[0])]
+    return reducer(partials)
+
+
+# Partial aggregates (module level so they can be pickled to worker processes)
+
+def _count_values(frame, columns):
+    return pd.concat([frame[column] for column in columns]).value_counts()
+
+
+def _group(frame, by, column, how):
+    return frame.groupby(by)[column].agg(how)
+
+
+def _merge(partials, how, name):
+    if not partials:
+        return pd.Series(dtype='int64', name=name)
+    if len(partials) == 1:
+        return partials[0].rename(name)
+    return pd.concat(partials).groupby(level=0).agg(how).rename(name)
+
+
+def value_counts(data, columns, **kwargs):
+    # Counts of each value across one or more columns, largest first (like Series.value_counts)
+    columns = [columns] if isinstance(columns, str) else list(columns)
+    counts = map_reduce(data, partial(_count_values, columns=columns), partial(_merge, how='sum', name='count'), **kwargs)
+    return counts.sort_values(ascending=False, kind='stable')
+
+
+def group_count(data, by, column, **kwargs):
+    return map_reduce(data, partial(_group, by=by, column=column, how='count'), partial(_merge, how='sum', name=column), **kwargs)
+
+
+def group_sum(data, by, column, **kwargs):
+    return map_reduce(data, partial(_group, by=by, column=column, how='sum'), partial(_merge, how='sum', name=column), **kwargs)
+
+
+def group_max(data, by, column, **kwargs):
+    return map_reduce(data, partial(_group, by=by, column=column, how='max'), partial(_merge, how='max', name=column), **kwargs)
@@ -0,0 +1,310 @@
+import argparse
+import importlib
+import os
+from functools import lru_cache
+
+import dash
+from dash import html, dcc, Input, Output
+from flask import Flask, redirect
+import pandas as pd
+import plotly.express as px
+
+import aggregate
+from fantasy import FantasyEngine
+from payload import downsample, enable_gzip, top_n
+from schema import load_csv
+from similarity import PlayerIndex
+from trends import TrendStore
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Dataset handles: one entry per season/league, naming the CSVs (relative to DATA_DIR) it is built from.
+# `history` lists career snapshots in season order for the player trend store; `auction` and `teams`
+# (sold players and team funds) are optional and feed the fantasy engine.
+DATASETS = {
+    'ipl-2022': {
+        'matches': 'IPL_Matches_2022.csv',
+        'players': 'IPL_Data.csv',
+        'history': [('2022', 'IPL_Data.csv')],
+        'auction': 'ipl2022 - soldplayersipl2022.csv',
+        'teams': 'ipl2022 - teamdetails.csv',
+    },
+}
+
+# Layout variants: modules exposing `layout(core)` and `card_style`
+VARIANTS = ['v1', 'v2withlayout', 'rowscolumns']
+
+DEFAULT_DATASET = 'ipl-2022'
+DEFAULT_VARIANT = 'v2withlayout'
+
+
+class DataCore:
+    # Loaded frames and every aggregate the layouts draw from; built once per dataset and shared by all apps
+
+    def __init__(self, name, ipl_data, player_data, history=(), sold_players=None, team_details=None):
+        self.name = name
+        self.ipl_data = ipl_data
+        self.player_data = player_data
+        self.teams = player_data['Team'].unique()
+        self.player_index = PlayerIndex.from_frame(player_data)
+        self.trends = TrendStore()
+        for season, snapshot in history:
+            self.trends.append_season(season, snapshot)
+        self.fantasy = FantasyEngine(player_data, sold_players, team_details)
+
+        self.total_matches_played = aggregate.value_counts(ipl_data, ['team1', 'team2']).astype(int)
+        self.total_won = aggregate.value_counts(ipl_data, 'match_winner')
+        self.win_percentage = ((self.total_won / self.total_matches_played) * 100).sort_values(ascending=False).astype(int)
+
+        self.team_performance = pd.DataFrame({
+            'Total Matches Played': self.total_matches_played,
+            'Total Matches Won': self.total_won,
+            'Win Percentage (%)': self.win_percentage
+        }).sort_values(by='Win Percentage (%)', ascending=False)
+
+        self.pom = aggregate.group_count(ipl_data, 'player_of_the_match', 'match_id').sort_values(ascending=False)
+        self.score = aggregate.group_sum(ipl_data, 'top_scorer', 'highscore').sort_values(ascending=False)
+        self.bowler = aggregate.group_count(ipl_data, 'best_bowling', 'match_id').sort_values(ascending=False)
+        toss_match_won = ipl_data[ipl_data['toss_winner'] == ipl_data['match_winner']]['match_winner'].value_counts()
+        match_won = ipl_data['match_winner'].value_counts()
+        self.percentage_won = (toss_match_won / match_won * 100).astype(int).sort_values(ascending=False)
+        self.win_method_counts = ipl_data["won_by"].value_counts()
+        self.venue_counts = ipl_data['venue'].value_counts()
+        self.toss_winner_counts = ipl_data['toss_winner'].value_counts()
+
+        # Toss Decision Distribution
+        self.toss_decision_distribution = ipl_data['toss_decision'].value_counts()
+
+        # Winning Margin Distribution
+        self.winning_margin_distribution = ipl_data['won_by'].value_counts()
+
+        # Player of the Match Analysis
+        self.player_of_the_match_analysis = ipl_data['player_of_the_match'].value_counts()[:5]
+
+        # Top Scorer Analysis
+        self.top_scorer_analysis = downsample(aggregate.group_max(ipl_data, 'top_scorer', 'highscore').reset_index(), 'top_scorer', 'highscore')
+
+        # Best Bowling Performance
+        best_bowling_performance = aggregate.group_count(ipl_data, 'best_bowling', 'match_id').reset_index()
+        best_bowling_performance.columns = ['Best Bowling', 'Frequency']
+        self.best_bowling_performance = best_bowling_performance.head()
+
+        # Venue Analysis
+        self.venue_analysis = top_n(self.venue_counts)
+
+
+@lru_cache(maxsize=None)
+def load_core(dataset=DEFAULT_DATASET):
+    files = DATASETS[dataset]
+
+    def path(name):
+        return os.path.join(DATA_DIR, name)
+
+    # One statement per CSV so the startup profile charges each load separately
+    ipl_data = load_csv(path(files['matches']))
+    player_data = load_csv(path(files['players']))
+    sold_players = load_csv(path(files['auction'])) if 'auction' in files else None
+    team_details = load_csv(path(files['teams'])) if 'teams' in files else None
+    history = [
+        (season, player_data if name == files['players'] else load_csv(path(name)))
+        for season, name in files.get('history', [])
+    ]
+    return DataCore(dataset, ipl_data, player_data, history, sold_players, team_details)
+
+
+def register_callbacks(app, core, card_style):
+    player_data = core.player_data
+
+    @app.callback(
+        Output('player-dropdown', 'options'),
+        Input('team-dropdown', 'value')
+    )
+    def set_player_options(selected_team):
+        filtered_df = player_data[player_data['Team'] == selected_team]
+        return [{'label': name, 'value': name} for name in filtered_df['Name']]
+
+    @app.callback(
+        Output('player-dropdown', 'value'),
+        Input('player-dropdown', 'options')
+    )
+    def set_player_value(available_options):
+        return available_options[0]['value'] if available_options else None
+
+    @app.callback(
+        Output('player-url', 'children'),
+        Input('player-dropdown', 'value')
+    )
+    def update_player_url(selected_player):
+        if selected_player:
+            player_row = player_data[player_data['Name'] == selected_player]
+            if not player_row.empty:
+                url = player_row['Url'].iloc[0]
+                return dcc.Link(url, href=url, target='_blank', style={'textDecoration': 'none'})
+        return "Select a player to see URL."
+
+    @app.callback(
+        Output('player-performance-board-div', 'children'),
+        Input('player-dropdown', 'value')
+    )
+    def update_player_performance_board(selected_player):
+        if selected_player:
+            # Filter player data based on selected player
+            player = player_data[player_data['Name'] == selected_player].iloc[0]
+
+            # Extract relevant performance metrics
+            runs_scored = player['RunsScored']
+            batting_avg = player['BattingAVG']
+            batting_sr = player['BattingS/R']
+            centuries = player['100s']
+            half_centuries = player['50s']
+            fours = player['4s']
+            sixes = player['6s']
+            catches_taken = player['CatchesTaken']
+            stumpings_made = player['StumpingsMade']
+            ducks = player['Ducks']
+            overs_bowled = player['Overs']
+            maidens = player['Maidens']
+            runs_conceded = player['RunsConceded']
+            wickets_taken = player['Wickets']
+            best_bowling = player['Best']
+            bowling_avg = player['BowlingAVG']
+            economy_rate = player['EconomyRate']
+            bowling_sr = player['S/R']
+
+            # Create HTML content to display player performance
+            performance_content = [
+                html.Div([
+                    html.Div([
+                        html.P(f"Runs Scored: {runs_scored}"),
+                        html.P(f"Batting Average: {batting_avg}"),
+                        html.P(f"Batting Strike Rate: {batting_sr}"),
+                        html.P(f"Centuries: {centuries}"),
+                        html.P(f"Half-centuries: {half_centuries}"),
+                    ], style=card_style),
+                    html.Div([
+                        html.P(f"Fours: {fours}"),
+                        html.P(f"Sixes: {sixes}"),
+                        html.P(f"Catches Taken: {catches_taken}"),
+                        html.P(f"Stumpings Made: {stumpings_made}"),
+                        html.P(f"Ducks: {ducks}"),
+                    ], style=card_style),
+                    html.Div([
+                        html.P(f"Overs Bowled: {overs_bowled}"),
+                        html.P(f"Maidens: {maidens}"),
+                        html.P(f"Runs Conceded: {runs_conceded}"),
+                        html.P(f"Wickets Taken: {wickets_taken}"),
+                        html.P(f"Best Bowling: {best_bowling}"),
+                    ], style=card_style),
+                    html.Div([
+                        html.P(f"Bowling Average: {bowling_avg}"),
+                        html.P(f"Economy Rate: {economy_rate}"),
+                        html.P(f"Bowling Strike Rate: {bowling_sr}"),
+                    ], style=card_style),
+                ], style={'display': 'flex', 'flexWrap': 'wrap', 'justifyContent': 'center'}),
+            ]
+
+            return performance_content
+        return "Select a player to see performance."
+
+    @app.callback(
+        Output('similar-players-div', 'children'),
+        Input('player-dropdown', 'value')
+    )
+    def update_similar_players(selected_player):
+        similar = core.player_index.query(selected_player) if selected_player else []
+        if similar:
+            return [
+                html.H4("Similar Players"),
+                html.Ul([html.Li(f"{name} ({team})") for name, team, _ in similar]),
+            ]
+        return "Select a player to see similar players."
+
+    @app.callback(
+        Output('player-performance', 'figure'),
+        Input('player-dropdown', 'value')
+    )
+    def update_player_performance(selected_player):
+        history = core.trends.history(selected_player)
+        seasons = history[~history['baseline'].astype(bool)]
+        if seasons.empty and not history.empty:
+            # Only the first career snapshot so far: it has no earlier season to difference against
+            return px.bar(
+                history.tail(1), x='season', y=['career_runs', 'career_wickets'], barmode='group', text_auto=True,
+                title=f"{selected_player} Career Totals (per-season trend needs a second snapshot)",
+                labels={'season': 'Career up to Season', 'value': 'Career Total', 'variable': 'Stat'}
+            )
+        return px.line(
+            seasons, x='season', y=['runs', 'wickets', 'strike_rate'], markers=True,
+            title=f"{selected_player or 'Player'} by Season",
+            labels={'season': 'Season', 'value': 'Per Season', 'variable': 'Stat'}
+        )
+
+    @app.callback(
+        Output('squad-suggestions-div', 'children'),
+        Input('team-dropdown', 'value')
+    )
+    def update_squad_suggestions(selected_team):
+        budget = core.fantasy.team_budget(selected_team) if selected_team else None
+        if budget is None:
+            return "No auction funds available for this team."
+        funds, slots, overseas_slots = budget
+        squad = core.fantasy.optimize_squad(funds, slots, overseas_slots, exclude_team=selected_team)
+        best_value = core.fantasy.value_for_money().head(5)
+        return [
+            html.H4("Hypothetical Fantasy Pick"),
+            html.P(f"Funds remaining: {funds:.2f} CR, open slots: {slots} ({overseas_slots} overseas)"),
+            html.P("Most fantasy points from other franchises' players within these funds; "
+                   "they are under contract, so this is not a list of available signings."),
+            html.Ul([
+                html.Li(f"{name} ({team}): {points:.0f} pts for {price:.2f} CR")
+                for name, team, points, price in squad[['Name', 'Team', 'Points', 'Price (CR)']].itertuples(index=False)
+            ])
+            if not squad.empty else html.P("No affordable pick adds points."),
+            html.H5("Best Points per CR"),
+            html.Ul([
+                html.Li(f"{name} ({team}): {per_cr:.0f} pts/CR")
+                for name, team, per_cr in best_value[['Name', 'Team', 'Points per CR']].itertuples(index=False)
+            ]),
+        ]
+
+
+def create_app(dataset=DEFAULT_DATASET, variant=DEFAULT_VARIANT, server=True, url_base_pathname=None):
+    # Apps built for the same dataset share one DataCore; pass a Flask `server` to mount several in one process
+    core = load_core(dataset)
+    module = importlib.import_module(variant)
+    app = dash.Dash(module.__name__, server=server, url_base_pathname=url_base_pathname)
+    enable_gzip(app.server)
+    app.title = f"Cricket Dashboard - {dataset}"
+    app.layout = module.layout(core)
+    register_callbacks(app, core, module.card_style)
+    return app
+
+
+def create_server(mounts):
+    # One Flask server hosting an app per (dataset, variant) at /<dataset>/<variant>/
+    server = Flask(__name__)
+    apps = [create_app(dataset, variant, server=server, url_base_pathname=f"/{dataset}/{variant}/") for dataset, variant in mounts]
+    index = apps[0].config.url_base_pathname
+
+    @server.route('/')
+    def home():
+        return redirect(index)
+
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Serve several dashboards from one process.')
+    parser.add_argument('--mount', action='append', metavar='DATASET:VARIANT',
+                        help=f"app to mount (repeatable); default: every variant of {DEFAULT_DATASET}")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8050)
+    parser.add_argument('--debug', action='store_true')
+    args = parser.parse_args(argv)
+
+    mounts = [tuple(mount.split(':', 1)) for mount in args.mount] if args.mount else [(DEFAULT_DATASET, variant) for variant in VARIANTS]
+    create_server(mounts).run(host=args.host, port=args.port, debug=args.debug)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,212 @@
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Default fantasy rule set: points per unit of each IPL_Data.csv stat column
+RULES = {
+    'RunsScored': 1,
+    '4s': 1,
+    '6s': 2,
+    'Wickets': 25,
+    'Maidens': 12,
+    'CatchesTaken': 8,
+    'StumpingsMade': 12,
+}
+
+# teamdetails/topbuys use franchise names, IPL_Data.csv uses team codes
+TEAM_CODES = {
+    'Chennai Super Kings': 'CSK',
+    'Delhi Capitals': 'DC',
+    'Gujarat Titans': 'GT',
+    'Kolkata Knight Riders': 'KKR',
+    'Lucknow Super Giants': 'LSG',
+    'Mumbai Indians': 'MI',
+    'Punjab Kings': 'PBKS',
+    'Rajasthan Royals': 'RR',
+    'Royal Challengers Bangalore': 'RCB',
+    'Sunrisers Hyderabad': 'SRH',
+}
+
+SQUAD_LIMIT = 25
+OVERSEAS_LIMIT = 8
+
+# Prices are optimized in whole lakhs (0.01 crore)
+LAKHS_PER_CR = 100
+RUPEES_PER_CR = 10 ** 7
+
+# Upper bound on the optimizer's choice table; larger budgets are solved in coarser price steps
+MAX_KEEP_BYTES = 32 * 2 ** 20
+
+
+def _key(rules):
+    return tuple(sorted(rules.items()))
+
+
+def _price_step(cells, lakhs):
+    # (price step in lakhs, capacity in steps) for a choice table of `cells` bit-packed rows. The step is one lakh
+    # unless the rows, at capacity // 8 + 1 bytes each, would outgrow MAX_KEEP_BYTES.
+    if cells > MAX_KEEP_BYTES:
+        raise ValueError(f"{cells} optimizer cells exceed the memory bound of {MAX_KEEP_BYTES} bytes")
+    max_capacity = 8 * (MAX_KEEP_BYTES // max(cells, 1)) - 1
+    step = max(1, int(np.ceil(lakhs / max_capacity - 1e-9)))
+    return step, min(int(np.floor(lakhs / step + 1e-9)), max_capacity)
+
+
+class FantasyEngine:
+    # Vectorized fantasy scoring over the player table; results are cached per rule set
+
+    def __init__(self, player_data, sold_players=None, team_details=None):
+        self.players = player_data.reset_index(drop=True)
+        self.team_details = team_details
+        self._stats = {}
+        self._cache = {}
+        self.auction_price = pd.Series(np.nan, index=self.players.index)
+        nationality = np.full(len(self.players), None, dtype=object)
+        if sold_players is not None:
+            paid = sold_players.groupby('Players')['Price Paid'].max() / RUPEES_PER_CR
+            self.auction_price = self.players['Name'].map(paid)
+            nationality = self.players['Name'].map(sold_players.groupby('Players')['Nationality'].first()).to_numpy(dtype=object)
+        # Overseas flag from the auction's Nationality, else IPL_Data.csv's National Side; a player with
+        # neither counts as overseas, so the overseas limit holds whatever the missing value is
+        side = self.players['National Side'].to_numpy(dtype=object)
+        self.overseas = np.where(
+            pd.notna(nationality), nationality != 'Indian', np.where(pd.notna(side), side != 'India', True)
+        ).astype(int)
+
+    def _column(self, name):
+        if name not in self._stats:
+            self._stats[name] = pd.to_numeric(self.players[name], errors='coerce').fillna(0).to_numpy(dtype=float)
+        return self._stats[name]
+
+    def points(self, rules=None):
+        rules = RULES if rules is None else rules
+        key = _key(rules)
+        if key not in self._cache:
+            columns = list(rules)
+            matrix = np.column_stack([self._column(column) for column in columns]) if columns else np.zeros((len(self.players), 0))
+            self._cache[key] = matrix @ np.array([rules[column] for column in columns], dtype=float)
+        return self._cache[key]
+
+    def prices(self, price='value'):
+        # 'value' is the ValueinCR column, 'auction' the 2022 price paid; both in crores
+        if price == 'auction':
+            return self.auction_price.to_numpy(dtype=float)
+        return self._column('ValueinCR')
+
+    def value_for_money(self, rules=None, price='value'):
+        points = self.points(rules)
+        prices = self.prices(price)
+        per_cr = np.divide(points, prices, out=np.full_like(points, np.nan), where=prices > 0)
+        ranking = pd.DataFrame({
+            'Name': self.players['Name'],
+            'Team': self.players['Team'],
+            'Type': self.players['Type'],
+            'Points': points,
+            'Price (CR)': prices,
+            'Points per CR': per_cr,
+        })
+        return ranking.dropna(subset=['Points per CR']).sort_values('Points per CR', ascending=False)
+
+    def team_budget(self, team):
+        # (funds in crores, open squad slots, open overseas slots) from the teamdetails CSV, or None if unknown
+        if self.team_details is None:
+            return None
+        details = self.team_details.assign(code=self.team_details['TEAM'].map(TEAM_CODES).fillna(self.team_details['TEAM']))
+        rows = details[(details['code'] == team) | (details['TEAM'] == team)]
+        if rows.empty:
+            return None
+        row = rows.iloc[0]
+        return (
+            float(row['FUNDS REMAINING']) / RUPEES_PER_CR,
+            SQUAD_LIMIT - int(row['TOTAL PLAYERS']),
+            OVERSEAS_LIMIT - int(row['OVERSEAS PLAYERS']),
+        )
+
+    def optimize_squad(self, budget, slots=SQUAD_LIMIT, overseas_slots=OVERSEAS_LIMIT, rules=None, price='value', exclude_team=None):
+        # 0/1 knapsack: most points for at most `budget` crores, `slots` players and `overseas_slots` overseas players.
+        # Candidates are every priced player outside `exclude_team`, i.e. a hypothetical fantasy pick, not an
+        # auction pool: the data has no list of uncontracted players.
+        points = self.points(rules)
+        prices = self.prices(price)
+        candidates = np.flatnonzero((prices > 0) & (points > 0))
+        if exclude_team is not None:
+            candidates = candidates[self.players['Team'].to_numpy()[candidates] != exclude_team]
+
+        slots = min(slots, len(candidates))
+        overseas_slots = min(overseas_slots, slots)
+        cells = len(candidates) * (slots + 1) * (overseas_slots + 1)
+        step, capacity = _price_step(cells, budget * LAKHS_PER_CR)
+        chosen = []
+        if capacity > 0 and slots > 0:
+            # Costs round up to the step, so a coarse step can only leave funds unspent, never overspend
+            costs = np.ceil(np.round(prices[candidates] * LAKHS_PER_CR) / step - 1e-9).astype(int)
+            chosen = self._knapsack(candidates, costs, points, self.overseas, capacity, slots, overseas_slots)
+        squad = self.players.loc[chosen, ['Name', 'Team', 'Type']]
+        return squad.assign(Points=points[chosen], **{'Price (CR)': prices[chosen]})
+
+    @staticmethod
+    def _knapsack(candidates, costs, points, overseas, capacity, slots, overseas_slots):
+        # best[s, o, b]: most points with at most s players, o of them overseas, costing at most b steps
+        best = np.zeros((slots + 1, overseas_slots + 1, capacity + 1))
+        # keep[item, s, o]: whether the item is taken in cell (s, o, b), bit-packed along b
+        keep = np.zeros((len(candidates), slots + 1, overseas_slots + 1, capacity // 8 + 1), dtype=np.uint8)
+        taken_cells = np.zeros((slots + 1, overseas_slots + 1, capacity + 1), dtype=bool)
+        for item, player in enumerate(candidates):
+            cost, foreign, value = costs[item], overseas[player], points[player]
+            if cost > capacity or foreign > overseas_slots:
+                continue
+            taken = best[:-1, :overseas_slots + 1 - foreign, :capacity + 1 - cost] + value
+            current = best[1:, foreign:, cost:]
+            better = taken > current
+            taken_cells[:] = False
+            taken_cells[1:, foreign:, cost:] = better
+            keep[item] = np.packbits(taken_cells, axis=-1)
+            best[1:, foreign:, cost:] = np.where(better, taken, current)
+
+        chosen = []
+        s, o, b = slots, overseas_slots, capacity
+        for item in range(len(candidates) - 1, -1, -1):
+            if keep[item, s, o, b >> 3] >> (7 - (b & 7)) & 1:
+                player = candidates[item]
+                chosen.append(player)
+                s, o, b = s - 1, o - overseas[player], b - costs[item]
+        return chosen[::-1]
+
+
+def check(trials=300, seed=0):
+    # Compares _knapsack against brute force over every subset of a few random players, and the price step
+    # against MAX_KEEP_BYTES for squads up to 20k candidates; returns the number of failures
+    rng = np.random.default_rng(seed)
+    failures = 0
+    for trial in range(trials):
+        n = int(rng.integers(1, 9))
+        points = rng.integers(0, 50, n).astype(float)
+        costs = rng.integers(1, 12, n)
+        overseas = rng.integers(0, 2, n)
+        capacity, slots = int(rng.integers(1, 30)), int(rng.integers(1, n + 1))
+        overseas_slots = int(rng.integers(0, slots + 1))
+        best = 0
+        for mask in range(1 << n):
+            subset = [i for i in range(n) if mask >> i & 1]
+            if len(subset) <= slots and overseas[subset].sum() <= overseas_slots and costs[subset].sum() <= capacity:
+                best = max(best, points[subset].sum())
+        chosen = FantasyEngine._knapsack(np.arange(n), costs, points, overseas, capacity, slots, overseas_slots)
+        feasible = len(chosen) <= slots and overseas[chosen].sum() <= overseas_slots and costs[chosen].sum() <= capacity
+        if not feasible or points[chosen].sum() != best:
+            print(f"knapsack trial {trial}: got {points[chosen].sum()} (feasible={feasible}), brute force {best}")
+            failures += 1
+    for candidates in (1, 200, 2000, 20000):
+        cells = candidates * (SQUAD_LIMIT + 1) * (OVERSEAS_LIMIT + 1)
+        for budget in (0.5, 20, 100, 1000):
+            step, capacity = _price_step(cells, budget * LAKHS_PER_CR)
+            if cells * (capacity // 8 + 1) > MAX_KEEP_BYTES or capacity * step > budget * LAKHS_PER_CR + 1e-6:
+                print(f"price step: {candidates} candidates, {budget} CR -> step {step}, capacity {capacity}")
+                failures += 1
+    return failures
+
+
+if __name__ == '__main__':
+    failures = check()
+    print(f"{failures} failures" if failures else 'ok')
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,193 @@
+import argparse
+import http.client
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+import numpy as np
+
+from dashboard import DATA_DIR, DATASETS, DEFAULT_DATASET, DEFAULT_VARIANT
+from schema import load_csv
+
+# Callbacks fired by the browser when a user changes the team or player dropdowns. A team change also
+# fires CHAINED_CALLBACK with the new player options, which selects the team's first player.
+TEAM_CALLBACKS = [('player-dropdown', 'options'), ('squad-suggestions-div', 'children')]
+CHAINED_CALLBACK = ('player-dropdown', 'value')
+PLAYER_CALLBACKS = [
+    ('player-url', 'children'),
+    ('player-performance-board-div', 'children'),
+    ('similar-players-div', 'children'),
+    ('player-performance', 'figure'),
+]
+
+PERCENTILES = [50, 95, 99]
+
+DEFAULT_TARGET = f"http://127.0.0.1:8050/{DEFAULT_DATASET}/{DEFAULT_VARIANT}/"
+
+
+class Workload:
+    # Team/player selection patterns drawn from IPL_Data.csv: teams in proportion to squad size,
+    # players within a team in proportion to their ValueinCR (star players get looked up more)
+
+    def __init__(self, player_data, seed=None):
+        self.random = random.Random(seed)
+        self.teams = player_data['Team'].value_counts()
+        self.players = {
+            team: (list(group['Name']), list(group['ValueinCR'].fillna(0) + 0.1))
+            for team, group in player_data.groupby('Team')
+        }
+
+    def team(self):
+        return self.random.choices(list(self.teams.index), weights=list(self.teams.values))[0]
+
+    def names(self, team):
+        return self.players[team][0]
+
+    def player(self, team):
+        names, weights = self.players[team]
+        return self.random.choices(names, weights=weights)[0]
+
+
+def callback_body(output_id, output_property, input_id, input_property, value):
+    return json.dumps({
+        'output': f"{output_id}.{output_property}",
+        'outputs': {'id': output_id, 'property': output_property},
+        'inputs': [{'id': input_id, 'property': input_property, 'value': value}],
+        'changedPropIds': [f"{input_id}.{input_property}"],
+        'state': [],
+    })
+
+
+class Session(threading.Thread):
+    # One simulated user on a keep-alive connection: pick a team, then browse a few of its players
+
+    def __init__(self, target, workload, deadline, results, think_time, players_per_team):
+        super().__init__(daemon=True)
+        url = urlsplit(target)
+        self.host, self.port = url.hostname, url.port or (443 if url.scheme == 'https' else 80)
+        self.https = url.scheme == 'https'
+        self.endpoint = url.path.rstrip('/') + '/_dash-update-component'
+        self.workload = workload
+        self.deadline = deadline
+        self.results = results
+        self.think_time = think_time
+        self.players_per_team = players_per_team
+        self.connection = None
+
+    def _connect(self):
+        connection_class = http.client.HTTPSConnection if self.https else http.client.HTTPConnection
+        self.connection = connection_class(self.host, self.port, timeout=30)
+
+    def post(self, output_id, output_property, input_id, input_property, value):
+        body = callback_body(output_id, output_property, input_id, input_property, value)
+        headers = {'Content-Type': 'application/json', 'Accept-Encoding': 'gzip'}
+        start = time.perf_counter()
+        ok = False
+        try:
+            if self.connection is None:
+                self._connect()
+            self.connection.request('POST', self.endpoint, body, headers)
+            response = self.connection.getresponse()
+            response.read()
+            ok = response.status == 200
+        except (OSError, http.client.HTTPException):
+            if self.connection is not None:
+                self.connection.close()
+            self.connection = None
+        self.results.append((f"{output_id}.{output_property}", time.perf_counter() - start, ok))
+
+    def think(self):
+        if self.think_time:
+            time.sleep(self.workload.random.expovariate(1 / self.think_time))
+
+    def select(self, player):
+        for output_id, output_property in PLAYER_CALLBACKS:
+            self.post(output_id, output_property, 'player-dropdown', 'value', player)
+
+    def run(self):
+        while time.perf_counter() < self.deadline:
+            team = self.workload.team()
+            for output_id, output_property in TEAM_CALLBACKS:
+                self.post(output_id, output_property, 'team-dropdown', 'value', team)
+            names = self.workload.names(team)
+            options = [{'label': name, 'value': name} for name in names]
+            self.post(*CHAINED_CALLBACK, 'player-dropdown', 'options', options)
+            self.select(names[0])
+            for _ in range(self.players_per_team):
+                if time.perf_counter() >= self.deadline:
+                    break
+                self.think()
+                self.select(self.workload.player(team))
+        if self.connection is not None:
+            self.connection.close()
+
+
+def run(target, player_data, users, duration, think_time=0.5, players_per_team=3, seed=None):
+    results = []
+    deadline = time.perf_counter() + duration
+    sessions = [
+        Session(target, Workload(player_data, None if seed is None else seed + i), deadline, results, think_time, players_per_team)
+        for i in range(users)
+    ]
+    start = time.perf_counter()
+    for session in sessions:
+        session.start()
+    for session in sessions:
+        session.join()
+    return results, time.perf_counter() - start
+
+
+def summarize(results, elapsed):
+    # Rows of (endpoint, requests, throughput/s, error rate, p50, p95, p99 in ms); the last row covers all endpoints
+    by_endpoint = defaultdict(list)
+    for endpoint, latency, ok in results:
+        by_endpoint[endpoint].append((latency, ok))
+    by_endpoint['all'] = [(latency, ok) for _, latency, ok in results]
+    rows = []
+    for endpoint, samples in by_endpoint.items():
+        if not samples:
+            continue
+        latencies = np.array([latency for latency, _ in samples]) * 1000
+        errors = sum(not ok for _, ok in samples)
+        rows.append((endpoint, len(samples), len(samples) / elapsed, errors / len(samples), *np.percentile(latencies, PERCENTILES)))
+    return rows
+
+
+def report(label, rows):
+    print(f"\n{label}")
+    print(f"  {'endpoint':<40} {'requests':>8} {'req/s':>8} {'errors':>7} " + ' '.join(f"{f'p{p} ms':>8}" for p in PERCENTILES))
+    for endpoint, count, throughput, error_rate, *percentiles in rows:
+        print(f"  {endpoint:<40} {count:>8} {throughput:>8.1f} {error_rate:>7.1%} " + ' '.join(f"{value:>8.1f}" for value in percentiles))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Drive dashboard callbacks with concurrent simulated users.')
+    parser.add_argument('--target', action='append', metavar='LABEL=URL',
+                        help=f"app to test, e.g. dev={DEFAULT_TARGET} or gunicorn=http://127.0.0.1:8000/ipl-2022/v1/ (repeatable)")
+    parser.add_argument('--users', type=int, default=20, help='concurrent sessions')
+    parser.add_argument('--duration', type=float, default=30, help='seconds per target')
+    parser.add_argument('--think-time', type=float, default=0.5, help='mean seconds between player selections (0 for none)')
+    parser.add_argument('--players-per-team', type=int, default=3)
+    parser.add_argument('--dataset', default=DEFAULT_DATASET, help='dataset whose players drive the selections')
+    parser.add_argument('--seed', type=int)
+    args = parser.parse_args(argv)
+
+    player_data = load_csv(os.path.join(DATA_DIR, DATASETS[args.dataset]['players']))
+    targets = [target.split('=', 1) if '=' in target else (target, target) for target in args.target or [DEFAULT_TARGET]]
+
+    failed = False
+    for label, url in targets:
+        results, elapsed = run(url, player_data, args.users, args.duration, args.think_time, args.players_per_team, args.seed)
+        rows = summarize(results, elapsed)
+        report(f"{label} ({url}): {args.users} users, {elapsed:.1f}s", rows)
+        failed = failed or not rows or rows[-1][3] > 0
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
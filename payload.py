@@ -0,0 +1,160 @@
+import base64
+import gzip
+from functools import lru_cache
+
+import dash
+import numpy as np
+import pandas as pd
+from flask import request
+
+# Point caps for charts whose size grows with the number of seasons loaded
+MAX_SCATTER_POINTS = 500
+MAX_BAR_CATEGORIES = 30
+
+# Trace keys that carry per-point data and are worth binary encoding
+ARRAY_KEYS = ('x', 'y', 'z', 'customdata', 'marker.color', 'marker.size')
+
+# plotly.js decodes {'dtype', 'bdata'} typed arrays from this version on
+MIN_TYPED_ARRAY_PLOTLYJS = (2, 28)
+
+# Only dynamic responses are gzipped; the _dash-component-suites JS bundles are static and large
+COMPRESSIBLE_TYPES = ('application/json', 'text/html')
+
+TYPED_DTYPES = {
+    'float64': 'f8', 'float32': 'f4',
+    'int32': 'i4', 'int16': 'i2', 'int8': 'i1',
+    'uint32': 'u4', 'uint16': 'u2', 'uint8': 'u1',
+}
+
+
+def lttb(x, y, threshold):
+    # Largest-Triangle-Three-Buckets: returns the indices of the points to keep
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    keep = np.empty(threshold, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    selected = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        bx, by = x[start:end], y[start:end]
+        area = np.abs((x[selected] - avg_x) * (by - y[selected]) - (x[selected] - bx) * (avg_y - y[selected]))
+        selected = start + int(area.argmax())
+        keep[i + 1] = selected
+    return keep
+
+
+def downsample(df, x, y, max_points=MAX_SCATTER_POINTS):
+    # Numeric x keeps the shape of the series; categorical x keeps the highest y values
+    if len(df) <= max_points:
+        return df
+    if pd.api.types.is_numeric_dtype(df[x]):
+        ordered = df.sort_values(x)
+        return ordered.iloc[lttb(ordered[x], ordered[y], max_points)]
+    return df.nlargest(max_points, y)
+
+
+def top_n(series, n=MAX_BAR_CATEGORIES, other_label='Other'):
+    # Keep the n largest categories and fold the tail into a single bar
+    if len(series) <= n:
+        return series
+    ordered = series.sort_values(ascending=False)
+    head = ordered.iloc[:n]
+    rest = ordered.iloc[n:].sum()
+    return pd.concat([head, pd.Series({other_label: rest}, name=series.name)])
+
+
+@lru_cache(maxsize=None)
+def typed_arrays_supported():
+    # Dash with `_setup_plotlyjs` serves the plotly.js bundled with plotly.py; older Dash ships its own,
+    # possibly pre-2.28, copy whose version we cannot check, so fall back to plain lists there
+    if not hasattr(dash.Dash, '_setup_plotlyjs'):
+        return False
+    from plotly.offline import get_plotlyjs_version
+    version = tuple(int(part) for part in get_plotlyjs_version().split('.')[:2])
+    return version >= MIN_TYPED_ARRAY_PLOTLYJS
+
+
+def decode_array(values):
+    data = np.frombuffer(base64.b64decode(values['bdata']), dtype=np.dtype(values['dtype']))
+    return data.tolist()
+
+
+def encode_array(values):
+    array = np.asarray(values)
+    if array.dtype == np.int64:
+        # plotly.js has no 64-bit integer typed array
+        info = np.iinfo(np.int32)
+        if len(array) and (array.min() < info.min or array.max() > info.max):
+            array = array.astype(np.float64)
+        else:
+            array = array.astype(np.int32)
+    dtype = TYPED_DTYPES.get(array.dtype.name)
+    if dtype is None or array.ndim != 1:
+        return values
+    return {'dtype': dtype, 'bdata': base64.b64encode(np.ascontiguousarray(array).tobytes()).decode('ascii')}
+
+
+def compact_figure(fig):
+    # Figure dict with numeric trace arrays sent as base64 typed arrays instead of JSON lists,
+    # or with every array as a plain list when the served plotly.js cannot decode typed arrays
+    figure = fig.to_dict() if hasattr(fig, 'to_dict') else fig
+    typed = typed_arrays_supported()
+    for trace in figure.get('data', []):
+        for key in ARRAY_KEYS:
+            *parents, leaf = key.split('.')
+            holder = trace
+            for parent in parents:
+                holder = holder.get(parent) if isinstance(holder, dict) else None
+            if not isinstance(holder, dict):
+                continue
+            values = holder.get(leaf)
+            if not typed:
+                if isinstance(values, dict) and 'bdata' in values:
+                    holder[leaf] = decode_array(values)
+                elif isinstance(values, (np.ndarray, pd.Series)):
+                    holder[leaf] = values.tolist()
+            elif isinstance(values, (list, tuple, np.ndarray, pd.Series)) and len(values):
+                try:
+                    holder[leaf] = encode_array(values)
+                except (TypeError, ValueError):
+                    pass
+    return figure
+
+
+def enable_gzip(server, min_size=1024, level=6):
+    # Compress JSON/HTML responses (layout, callback payloads) for clients that accept gzip.
+    # Safe to call once per app when several apps share a server.
+    if server.extensions.get('ipl_gzip'):
+        return server
+    server.extensions['ipl_gzip'] = True
+
+    @server.after_request
+    def compress_response(response):
+        if (
+            'gzip' not in request.headers.get('Accept-Encoding', '').lower()
+            or response.status_code < 200
+            or response.status_code >= 300
+            or response.direct_passthrough
+            or response.is_streamed
+            or response.mimetype not in COMPRESSIBLE_TYPES
+            or 'Content-Encoding' in response.headers
+        ):
+            return response
+        data = response.get_data()
+        if len(data) < min_size:
+            return response
+        response.set_data(gzip.compress(data, compresslevel=level))
+        response.headers['Content-Encoding'] = 'gzip'
+        response.headers['Content-Length'] = str(len(response.get_data()))
+        response.vary.add('Accept-Encoding')
+        return response
+
+    return server
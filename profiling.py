@@ -0,0 +1,136 @@
+import argparse
+import importlib
+import linecache
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Fail the check when startup takes longer than this many seconds (override with --budget)
+STARTUP_BUDGET = float(os.environ.get('STARTUP_BUDGET', 10))
+
+SAMPLE_INTERVAL = 0.001
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class Sampler(threading.Thread):
+    # Samples the main thread's stack; each sample is weighted by the microseconds since the previous one
+
+    def __init__(self, interval=SAMPLE_INTERVAL):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.target = threading.main_thread().ident
+        self.stacks = Counter()
+        self.running = True
+
+    def run(self):
+        last = time.perf_counter()
+        while self.running:
+            time.sleep(self.interval)
+            now = time.perf_counter()
+            frame = sys._current_frames().get(self.target)
+            if frame is not None:
+                self.stacks[self._stack(frame)] += int((now - last) * 1e6)
+            last = now
+
+    def stop(self):
+        self.running = False
+        self.join()
+
+    @staticmethod
+    def _stack(frame):
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append((code.co_filename, code.co_name, frame.f_lineno))
+            frame = frame.f_back
+        return tuple(reversed(stack))
+
+
+def folded(stacks):
+    # Collapsed-stack lines ("frame;frame;frame weight") read by flamegraph.pl and speedscope
+    lines = []
+    for stack, weight in stacks.most_common():
+        frames = [f"{name} ({os.path.basename(filename)}:{lineno})" for filename, name, lineno in stack]
+        lines.append(f"{';'.join(frames)} {weight}")
+    return '\n'.join(lines) + '\n'
+
+
+def breakdown(stacks, variant):
+    # Time per statement of the factory (dashboard.py) and the variant's layout module: imports, each
+    # CSV load, each DataCore aggregate, each px figure. Helpers such as aggregate.py and schema.py are
+    # charged to the line that called them, so separate aggregates and loads stay separate.
+    entry_files = {os.path.join(PROJECT_DIR, 'dashboard.py'), os.path.join(PROJECT_DIR, f"{variant}.py")}
+    totals = Counter()
+    for stack, weight in stacks.items():
+        lines = [(filename, lineno) for filename, name, lineno in stack if filename in entry_files]
+        if lines:
+            totals[lines[-1]] += weight
+    return [(filename, lineno, linecache.getline(filename, lineno).strip(), weight)
+            for (filename, lineno), weight in totals.most_common()]
+
+
+def peak_memory():
+    # Peak resident set size in bytes (ru_maxrss is KiB on Linux, bytes on macOS)
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def profile(variant, dataset=None, interval=SAMPLE_INTERVAL):
+    # Cold start of one app: importing the factory (dash/plotly/pandas), loading the data core, building the layout
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(interval)
+    sampler = Sampler(interval)
+    sampler.start()
+    start = time.perf_counter()
+    try:
+        dashboard = importlib.import_module('dashboard')
+        dashboard.create_app(dataset or dashboard.DEFAULT_DATASET, variant)
+    finally:
+        elapsed = time.perf_counter() - start
+        sampler.stop()
+        sys.setswitchinterval(switch_interval)
+    return elapsed, peak_memory(), sampler.stacks
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Profile dashboard startup.')
+    parser.add_argument('variant', help='layout variant to start, e.g. v2withlayout (or v2withlayout.py)')
+    parser.add_argument('--dataset', help='dataset handle (default: the factory default)')
+    parser.add_argument('--out', help='write a collapsed-stack profile for flame graphs')
+    parser.add_argument('--budget', type=float, default=STARTUP_BUDGET, help='startup budget in seconds')
+    parser.add_argument('--top', type=int, default=15, help='statements shown in the breakdown')
+    args = parser.parse_args(argv)
+
+    variant = os.path.splitext(os.path.basename(args.variant))[0]
+    elapsed, peak, stacks = profile(variant, args.dataset)
+
+    print(f"startup: {elapsed:.3f}s (budget {args.budget:.3f}s)")
+    if peak is not None:
+        print(f"peak memory: {peak / 2 ** 20:.1f} MiB")
+    sampled = sum(stacks.values()) or 1
+    for filename, lineno, source, weight in breakdown(stacks, variant)[:args.top]:
+        where = f"{os.path.basename(filename)}:{lineno}"
+        print(f"{weight / 1e6:8.3f}s {weight / sampled:6.1%}  {where:<20} {source[:70]}")
+    if args.out:
+        with open(args.out, 'w') as f:
+            f.write(folded(stacks))
+        print(f"profile written to {args.out}")
+
+    if elapsed > args.budget:
+        print(f"FAIL: startup exceeded budget by {elapsed - args.budget:.3f}s")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
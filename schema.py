@@ -0,0 +1,262 @@
+import os
+import sys
+
+import pandas as pd
+
+# Declared layout of every input CSV. Column options:
+#   dtype     'str', 'int64', 'float64' or 'rupees' (e.g. "₹2,00,00,000" -> 20000000)
+#   required  blanks are rejected
+#   min/max   inclusive numeric range
+#   values    allowed values (after `replace`)
+#   replace   spelling fixes applied before checking
+# Strings are always stripped, so "Batsman " is read as "Batsman".
+
+TYPES = ['Batsman', 'All-Rounder', 'Bowler', 'Wicket-Keeper']
+AUCTION_TYPES = ['Batsman', 'All-Rounder', 'Bowler', 'Wicket Keeper']
+
+
+def _stats(*columns, **options):
+    return {column: dict({'dtype': 'float64', 'min': 0}, **options) for column in columns}
+
+
+MATCHES = {
+    'key': ['match_id'],
+    'columns': {
+        'match_id': {'dtype': 'int64', 'required': True, 'min': 1},
+        'date': {'dtype': 'str', 'required': True},
+        'venue': {'dtype': 'str', 'required': True},
+        'team1': {'dtype': 'str', 'required': True},
+        'team2': {'dtype': 'str', 'required': True},
+        'stage': {'dtype': 'str', 'required': True, 'values': ['Group', 'Playoff', 'Final']},
+        'toss_winner': {'dtype': 'str', 'required': True},
+        'toss_decision': {'dtype': 'str', 'required': True, 'values': ['Bat', 'Field']},
+        'first_ings_score': {'dtype': 'int64', 'required': True, 'min': 0, 'max': 400},
+        'first_ings_wkts': {'dtype': 'int64', 'required': True, 'min': 0, 'max': 10},
+        'second_ings_score': {'dtype': 'int64', 'required': True, 'min': 0, 'max': 400},
+        'second_ings_wkts': {'dtype': 'int64', 'required': True, 'min': 0, 'max': 10},
+        'match_winner': {'dtype': 'str', 'required': True},
+        'won_by': {'dtype': 'str', 'required': True, 'values': ['Runs', 'Wickets']},
+        'margin': {'dtype': 'int64', 'required': True, 'min': 0},
+        'player_of_the_match': {'dtype': 'str', 'required': True},
+        'top_scorer': {'dtype': 'str', 'required': True},
+        'highscore': {'dtype': 'int64', 'required': True, 'min': 0, 'max': 200},
+        'best_bowling': {'dtype': 'str', 'required': True},
+        'best_bowling_figure': {'dtype': 'str', 'required': True},
+    },
+}
+
+PLAYERS = {
+    'key': ['Name', 'Team'],
+    'columns': {
+        'Name': {'dtype': 'str', 'required': True},
+        'Team': {'dtype': 'str', 'required': True},
+        'Url': {'dtype': 'str'},
+        'Type': {'dtype': 'str', 'required': True, 'values': TYPES, 'replace': {'Wicket-keeper': 'Wicket-Keeper'}},
+        'ValueinCR': {'dtype': 'float64', 'required': True, 'min': 0},
+        'Full Name': {'dtype': 'str'},
+        'Born': {'dtype': 'str'},
+        'Age': {'dtype': 'str'},
+        'National Side': {'dtype': 'str'},
+        'Batting Style': {'dtype': 'str'},
+        'Bowling': {'dtype': 'str'},
+        'Sport': {'dtype': 'str'},
+        **_stats('MatchPlayed', 'InningsBatted', 'NotOuts', 'RunsScored'),
+        'HighestInnScore': {'dtype': 'str'},
+        **_stats('100s', '50s', '4s', '6s', 'BattingAVG'),
+        **_stats('BattingS/R', max=600),
+        **_stats('CatchesTaken', 'StumpingsMade', 'Ducks', 'R/O', 'InningsBowled', 'Overs', 'Maidens', 'RunsConceded'),
+        **_stats('Wickets'),
+        'Best': {'dtype': 'str'},
+        **_stats('3s', '5s', 'BowlingAVG'),
+        **_stats('EconomyRate', max=36),
+        **_stats('S/R', 'Mtc'),
+    },
+}
+
+SOLD_PLAYERS = {
+    'key': ['Players', 'Team'],
+    'columns': {
+        'Players': {'dtype': 'str', 'required': True},
+        'Nationality': {'dtype': 'str', 'required': True, 'values': ['Indian', 'Overseas']},
+        'Type': {'dtype': 'str', 'required': True, 'values': AUCTION_TYPES},
+        'Price Paid': {'dtype': 'rupees', 'required': True, 'min': 0},
+        'Team': {'dtype': 'str', 'required': True},
+    },
+}
+
+TEAM_DETAILS = {
+    'skiprows': 1,
+    'key': ['TEAM'],
+    'columns': {
+        'TEAM': {'dtype': 'str', 'required': True},
+        'FUNDS REMAINING': {'dtype': 'rupees', 'required': True, 'min': 0},
+        'OVERSEAS PLAYERS': {'dtype': 'int64', 'required': True, 'min': 0, 'max': 8},
+        'TOTAL PLAYERS': {'dtype': 'int64', 'required': True, 'min': 0, 'max': 25},
+    },
+}
+
+TOP_BUYS = {
+    'key': ['PLAYER'],
+    'columns': {
+        'TEAM': {'dtype': 'str', 'required': True},
+        'PLAYER': {'dtype': 'str', 'required': True},
+        'TYPE': {'dtype': 'str', 'required': True, 'values': AUCTION_TYPES},
+        'PRICE': {'dtype': 'rupees', 'required': True, 'min': 0},
+    },
+}
+
+SCHEMAS = {
+    'IPL_Matches_2022.csv': MATCHES,
+    'Book_ipl22_ver_33.csv': MATCHES,
+    'IPL_Data.csv': PLAYERS,
+    'ipl2022 - soldplayersipl2022.csv': SOLD_PLAYERS,
+    'ipl2022 - teamdetails.csv': TEAM_DETAILS,
+    'ipl2022 - topbuys.csv': TOP_BUYS,
+}
+
+# Rows shown per failed check in a report
+SAMPLE_ROWS = 5
+
+
+class Report:
+
+    def __init__(self, source, rows):
+        self.source = source
+        self.rows = rows
+        self.header_lines = 1
+        self.issues = []
+
+    @property
+    def ok(self):
+        return not self.issues
+
+    def add(self, check, column, mask=None, detail=''):
+        # `mask` flags the offending rows; line numbers are reported as they appear in the file
+        if mask is None:
+            self.issues.append({'check': check, 'column': column, 'count': 1, 'lines': [], 'detail': detail})
+        elif mask.any():
+            lines = (mask[mask].index[:SAMPLE_ROWS] + self.header_lines + 1).tolist()
+            self.issues.append({'check': check, 'column': column, 'count': int(mask.sum()), 'lines': lines, 'detail': detail})
+
+    def __str__(self):
+        status = 'ok' if self.ok else f'{len(self.issues)} issue(s)'
+        lines = [f"{self.source}: {self.rows} rows, {status}"]
+        for issue in self.issues:
+            where = f" lines {issue['lines']}" if issue['lines'] else ''
+            detail = f" ({issue['detail']})" if issue['detail'] else ''
+            lines.append(f"  {issue['check']:<10} {issue['column']}: {issue['count']}{where}{detail}")
+        return '\n'.join(lines)
+
+
+class SchemaError(ValueError):
+
+    def __init__(self, report):
+        super().__init__(str(report))
+        self.report = report
+
+
+def _parse(raw, dtype):
+    if dtype == 'rupees':
+        raw = raw.str.replace(r'[₹,\s]', '', regex=True)
+    return pd.to_numeric(raw, errors='coerce')
+
+
+def validate(raw, schema, source='<frame>'):
+    # `raw` is the CSV read with every column as str; returns (typed frame, report)
+    report = Report(source, len(raw))
+    report.header_lines += schema.get('skiprows', 0)
+    columns = schema['columns']
+
+    missing = [column for column in columns if column not in raw.columns]
+    for column in missing:
+        report.add('missing', column)
+    for column in raw.columns:
+        if column not in columns:
+            report.add('unexpected', column)
+
+    typed = {}
+    for column, spec in columns.items():
+        if column in missing:
+            continue
+        values = raw[column].str.strip()
+        values = values.mask(values == '')
+        if spec.get('replace'):
+            values = values.replace(spec['replace'])
+        blank = values.isna()
+        dtype = spec.get('dtype', 'str')
+
+        if dtype == 'str':
+            parsed = values
+        else:
+            parsed = _parse(values, dtype)
+            report.add('type', column, parsed.isna() & ~blank, f"expected {dtype}")
+            if 'min' in spec:
+                report.add('range', column, parsed < spec['min'], f"< {spec['min']}")
+            if 'max' in spec:
+                report.add('range', column, parsed > spec['max'], f"> {spec['max']}")
+            if dtype in ('int64', 'rupees'):
+                fractional = parsed.notna() & (parsed % 1 != 0)
+                report.add('type', column, fractional, 'expected integer')
+                # A rejected column stays float rather than being truncated or failing the cast
+                if not fractional.any():
+                    parsed = parsed.astype('int64' if spec.get('required') and not parsed.isna().any() else 'Int64')
+            else:
+                parsed = parsed.astype('float64')
+
+        if spec.get('required'):
+            report.add('null', column, blank)
+        if spec.get('values'):
+            report.add('value', column, ~blank & ~values.isin(spec['values']))
+        typed[column] = parsed
+
+    frame = pd.DataFrame(typed, index=raw.index)
+    key = [column for column in schema.get('key', []) if column in frame]
+    if key:
+        report.add('duplicate', '+'.join(key), frame.duplicated(key, keep=False))
+    return frame, report
+
+
+def load_csv(path, schema=None, strict=True):
+    # Read and validate a CSV; a batch with any issue is rejected as a whole when `strict`
+    schema = schema or SCHEMAS[os.path.basename(path)]
+    raw = pd.read_csv(path, dtype=str, keep_default_na=False, skiprows=schema.get('skiprows', 0))
+    frame, report = validate(raw, schema, source=os.path.basename(path))
+    if strict and not report.ok:
+        raise SchemaError(report)
+    frame.attrs['report'] = report
+    return frame
+
+
+def duplicate_sources(frames):
+    # Pairs of inputs sharing rows, as (name, name, shared rows); catches re-exported copies of a file
+    hashes = {name: set(pd.util.hash_pandas_object(frame, index=False)) for name, frame in frames.items()}
+    names = list(frames)
+    found = []
+    for i, first in enumerate(names):
+        for second in names[i + 1:]:
+            if list(frames[first].columns) != list(frames[second].columns):
+                continue
+            shared = len(hashes[first] & hashes[second])
+            if shared:
+                found.append((first, second, shared))
+    return found
+
+
+def main(directory='.'):
+    frames = {}
+    failed = False
+    for name in SCHEMAS:
+        path = os.path.join(directory, name)
+        if not os.path.exists(path):
+            continue
+        frame = load_csv(path, strict=False)
+        print(frame.attrs['report'])
+        failed = failed or not frame.attrs['report'].ok
+        frames[name] = frame
+    for first, second, shared in duplicate_sources(frames):
+        print(f"duplicate: {first} and {second} share {shared} rows")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(*sys.argv[1:]))
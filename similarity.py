@@ -0,0 +1,75 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+# Numeric stat columns of IPL_Data.csv used as the player feature vector
+FEATURE_COLUMNS = ['RunsScored', 'BattingAVG', 'BattingS/R', '4s', '6s', 'Wickets', 'EconomyRate', 'S/R', 'ValueinCR']
+
+
+class PlayerIndex:
+    # k-nearest-neighbour index over z-score normalized player stat vectors.
+    # Every add() rebuilds the normalized matrix before returning, so queries never pay for it. The matrix and
+    # its row norms are published together as one tuple, so concurrent queries see either the old or new index.
+
+    def __init__(self, columns=FEATURE_COLUMNS):
+        self.columns = list(columns)
+        self.names = []
+        self.teams = []
+        self.rows = {}
+        self._raw = np.empty((0, len(self.columns)))
+        self._sum = np.zeros(len(self.columns))
+        self._sumsq = np.zeros(len(self.columns))
+        self._index = (np.empty((0, len(self.columns))), np.empty(0))
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_frame(cls, frame, columns=FEATURE_COLUMNS):
+        index = cls(columns)
+        index.add(frame)
+        return index
+
+    def __len__(self):
+        return len(self.names)
+
+    def add(self, frame):
+        # Blank stats (e.g. batsmen with no bowling figures) count as zero
+        features = frame[self.columns].apply(pd.to_numeric, errors='coerce').fillna(0).to_numpy(dtype=float)
+        with self._lock:
+            start = len(self.names)
+            self.names.extend(frame['Name'])
+            self.teams.extend(frame['Team'] if 'Team' in frame else [None] * len(frame))
+            for offset, name in enumerate(frame['Name']):
+                self.rows.setdefault(name, []).append(start + offset)
+            self._raw = np.vstack([self._raw, features])
+            self._sum += features.sum(axis=0)
+            self._sumsq += (features ** 2).sum(axis=0)
+            self._build()
+        return self
+
+    def _build(self):
+        n = len(self.names)
+        if not n:
+            return
+        mean = self._sum / n
+        std = np.sqrt(np.maximum(self._sumsq / n - mean ** 2, 0))
+        std[std == 0] = 1
+        matrix = (self._raw - mean) / std
+        self._index = (matrix, (matrix ** 2).sum(axis=1))
+
+    def query(self, name, k=5):
+        # Nearest players to the most recent row for `name`, as (name, team, distance) tuples
+        matrix, norms = self._index
+        # Rows appended by an add() still in progress are not in this snapshot yet
+        own = [row for row in self.rows.get(name, []) if row < len(matrix)]
+        if not own:
+            return []
+        row = own[-1]
+        distances = norms - 2 * matrix @ matrix[row] + norms[row]
+        distances[own] = np.inf
+        k = min(k, len(distances) - len(own))
+        if k <= 0:
+            return []
+        nearest = np.argpartition(distances, k - 1)[:k]
+        nearest = nearest[np.argsort(distances[nearest])]
+        return [(self.names[i], self.teams[i], float(np.sqrt(max(distances[i], 0)))) for i in nearest]
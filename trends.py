@@ -0,0 +1,127 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+# Per-season stats kept for every player; stored as season-over-season deltas of the career totals
+STATS = ['matches', 'runs', 'balls', 'wickets']
+
+
+def _career_totals(frame):
+    # Career totals from an IPL_Data.csv snapshot; balls faced are recovered from runs and batting strike rate
+    def column(name):
+        return pd.to_numeric(frame[name], errors='coerce').fillna(0).to_numpy(dtype=float)
+
+    runs = column('RunsScored')
+    strike_rate = column('BattingS/R')
+    balls = np.divide(runs * 100, strike_rate, out=np.zeros_like(runs), where=strike_rate > 0)
+    totals = np.column_stack([column('MatchPlayed'), runs, np.rint(balls), column('Wickets')])
+    return totals.astype(np.int64)
+
+
+class TrendStore:
+    # Append-only per-player, per-season history.
+    # Players and seasons are dictionary-encoded; stats are stored as int32 deltas between career snapshots.
+    # A player's first career snapshot has nothing to difference against, so its row is flagged as a baseline:
+    # career totals up to that season, not that season's figures. Every append rebuilds a CSR index (rows
+    # ordered by player id) and publishes it with the rows as one tuple, so concurrent history() calls see
+    # either the old or the new table and a player's history is a direct slice instead of a scan.
+
+    def __init__(self):
+        self.players = []
+        self.player_ids = {}
+        self.seasons = []
+        self._last = np.zeros((0, len(STATS)), dtype=np.int64)
+        self._seen = np.zeros(0, dtype=bool)
+        self._index = (
+            np.empty(0, dtype=np.int32), np.empty(0, dtype=np.uint16), np.empty((0, len(STATS)), dtype=np.int32),
+            np.empty(0, dtype=bool), np.empty(0, dtype=np.int64), np.zeros(1, dtype=np.int64),
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._index[0])
+
+    def _encode_players(self, names):
+        for name in names:
+            if name not in self.player_ids:
+                self.player_ids[name] = len(self.players)
+                self.players.append(name)
+        if len(self.players) > len(self._last):
+            grown = np.zeros((len(self.players), len(STATS)), dtype=np.int64)
+            grown[:len(self._last)] = self._last
+            self._last = grown
+            self._seen = np.concatenate([self._seen, np.zeros(len(self.players) - len(self._seen), dtype=bool)])
+        return np.fromiter((self.player_ids[name] for name in names), dtype=np.int32, count=len(names))
+
+    def append_season(self, season, frame, cumulative=True):
+        # `frame` is a player snapshot (IPL_Data.csv layout); career snapshots are differenced against the
+        # previous one, per-season frames (cumulative=False) are stored as-is
+        values = _career_totals(frame)
+        with self._lock:
+            if season in self.seasons:
+                raise ValueError(f"season {season!r} already appended")
+            ids = self._encode_players(list(frame['Name']))
+            if cumulative:
+                deltas = values - self._last[ids]
+                baseline = ~self._seen[ids]
+                self._last[ids] = values
+            else:
+                deltas = values
+                baseline = np.zeros(len(ids), dtype=bool)
+                self._last[ids] += values
+            self._seen[ids] = True
+
+            self.seasons.append(season)
+            player, season_codes, stats, baselines = self._index[:4]
+            self._build_index(
+                np.concatenate([player, ids]),
+                np.concatenate([season_codes, np.full(len(ids), len(self.seasons) - 1, dtype=np.uint16)]),
+                np.concatenate([stats, deltas.astype(np.int32)]),
+                np.concatenate([baselines, baseline]),
+            )
+        return self
+
+    def _build_index(self, player, season, stats, baseline):
+        order = np.argsort(player, kind='stable')
+        offsets = np.searchsorted(player[order], np.arange(len(self.players) + 1))
+        self._index = (player, season, stats, baseline, order, offsets)
+
+    def history(self, name):
+        # Per-season and cumulative stats for one player, oldest season first. Rows with `baseline` set hold
+        # career totals from a player's first snapshot rather than one season's figures.
+        columns = ['season'] + STATS + ['strike_rate', 'career_runs', 'career_wickets', 'baseline']
+        player = self.player_ids.get(name)
+        _, season, stats, baseline, order, offsets = self._index
+        # Players encoded by an append still in progress are not in this snapshot yet
+        if player is None or player + 1 >= len(offsets):
+            return pd.DataFrame(columns=columns)
+        rows = order[offsets[player]:offsets[player + 1]]
+        result = pd.DataFrame(stats[rows], columns=STATS)
+        result.insert(0, 'season', [self.seasons[code] for code in season[rows]])
+        balls = result['balls'].to_numpy(dtype=float)
+        result['strike_rate'] = np.round(np.divide(result['runs'] * 100, balls, out=np.zeros_like(balls), where=balls > 0), 2)
+        result['career_runs'] = result['runs'].cumsum()
+        result['career_wickets'] = result['wickets'].cumsum()
+        result['baseline'] = baseline[rows]
+        return result
+
+    def save(self, path):
+        player, season, stats, baseline = self._index[:4]
+        np.savez_compressed(
+            path,
+            players=np.array(self.players, dtype=str), seasons=np.array(self.seasons, dtype=str),
+            player=player, season=season, stats=stats, baseline=baseline, last=self._last, seen=self._seen,
+        )
+
+    @classmethod
+    def load(cls, path):
+        # Names are stored as fixed-width unicode, so nothing is unpickled
+        data = np.load(path)
+        store = cls()
+        store.players = data['players'].tolist()
+        store.player_ids = {name: i for i, name in enumerate(store.players)}
+        store.seasons = data['seasons'].tolist()
+        store._last, store._seen = data['last'], data['seen']
+        store._build_index(data['player'], data['season'], data['stats'], data['baseline'])
+        return store